@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """
 DAQ GUI controller (v3)
-- Single Responses pane (pretty JSON + concise summary)
+- Single Responses pane (concise summary + compact JSON; "Pretty JSON" toggle,
+  large payloads collapsed behind a click-to-expand placeholder)
 - Removed raw transcript and SD file listbox
 - LED slider retains inverted behavior (visual: right = dim, left = bright)
 - Layout improved to scale with window resizing
@@ -13,30 +14,139 @@ from tkinter import ttk, scrolledtext, messagebox, simpledialog
 import serial
 import serial.tools.list_ports
 import threading
+import queue
 import json
 import time
 import sys
 import re
+import os
+import select
+import collections
+import itertools
+import concurrent.futures
 
 BAUDRATE = 115200
 READ_TIMEOUT = 5
 CMD_TIMEOUT = 15
+RECORD_TEST_SECONDS = 1.2  # recording window of the full test (was 6 READs x 0.2 s)
+READER_POLL = 0.1  # serial read timeout for the background reader
+PORT_POLL_MS = 3000
+LOG_FLUSH_MS = 100
+LOG_MAX_LINES = 5000
+LOG_TRIM_LINES = 1000
+LARGE_JSON_CHARS = 512  # collapse responses bigger than this behind a click
+_NAV_KEYS = frozenset(("Left", "Right", "Up", "Down", "Prior", "Next", "Home", "End",
+                       "Shift_L", "Shift_R", "Control_L", "Control_R", "Meta_L", "Meta_R"))
+_SUMMARY_KEYS = ("ok", "cmd", "msg")
+_DECODER = json.JSONDecoder()
+_scanstring = json.decoder.scanstring
+_WS = re.compile(r'[ \t\n\r]*')
+_COMPACT_JSON = json.JSONEncoder(separators=(',', ':'))
+_PRETTY_JSON = json.JSONEncoder(indent=2)
 
 # ---------------- Serial comm helper ----------------
+def _try_extract_json(raw):
+    """Fallback for a line that isn't clean JSON: parse the outermost {...} in it.
+
+    Plain find/rfind instead of a regex keeps this O(n) with no backtracking.
+    """
+    i = raw.find(b'{')
+    if i < 0:
+        return None
+    j = raw.rfind(b'}')
+    if j <= i:
+        return None
+    try:
+        return json.loads(raw[i:j + 1])
+    except ValueError:
+        return None
+
+# markers queued in place of a response line: the reader thread hit a read
+# error, or close() was called while a command may be waiting
+_READER_FAILED = object()
+_PORT_CLOSED = object()
+
+# Reader-thread primitive, picked once at import time. Each call returns whatever
+# bytes are available (possibly b'') within about READER_POLL seconds.
+if os.name == 'posix':
+    def _read_chunk(ser):
+        # select + os.read straight on the fd, bypassing pyserial's VMIN/VTIME handling
+        fd = ser.fileno()
+        ready, _, _ = select.select([fd], [], [], READER_POLL)
+        if not ready:
+            return b''
+        try:
+            data = os.read(fd, 4096)
+        except BlockingIOError:
+            return b''
+        if not data:
+            # readable but empty means the device went away (e.g. USB unplugged)
+            raise serial.SerialException("device reports readiness to read but returned no data")
+        return data
+else:
+    def _read_chunk(ser):
+        data = ser.read(ser.in_waiting or 1)
+        if len(data) == 1 and ser.in_waiting:
+            # woke up on the first byte of a response; grab the rest now
+            data += ser.read(ser.in_waiting)
+        return data
+
+class ResponseSummary(dict):
+    """Top-level ok/cmd/msg of a large response; the full document is parsed on demand."""
+    def __init__(self, fields, text):
+        super().__init__(fields)
+        self.text = text
+
+    def full(self):
+        return json.loads(self.text)
+
 class SerialComm:
+    _CMD_CACHE = {c: c.encode('utf-8') + b'\n' for c in (
+        "PING", "STATUS", "READ", "TARE", "START", "STOP",
+        "LIST_FILES", "GET_LED", "TEST_TEMP", "TEST_PRESSURE")}
+
     def __init__(self):
         self.ser = None
-        self.lock = threading.Lock()
-
-    def open(self, port, baud=BAUDRATE, timeout=READ_TIMEOUT):
+        self.lock = threading.Lock()  # guards self.ser
+        # held for a whole send_many exchange; separate from self.lock so
+        # is_open()/close() never wait on a pending response
+        self._txn_lock = threading.Lock()
+        self._rx_queue = queue.Queue()
+        self._reader = None
+        self._stop = threading.Event()
+        self._read_error = None  # set by the reader thread if the port fails
+
+    def open(self, port, baud=BAUDRATE):
+        """Open port and start the reader thread.
+
+        Per-command timeouts are passed to send_cmd/send_many; the port itself
+        uses a short READER_POLL timeout so close() stays snappy.
+        """
+        self.close()
         with self.lock:
-            if self.ser and self.ser.is_open:
-                self.ser.close()
-            self.ser = serial.Serial(port, baudrate=baud, timeout=timeout)
+            self._drain()  # drop the close() wake-up marker
+            self._read_error = None
+            self.ser = serial.Serial(port, baudrate=baud, timeout=READER_POLL)
+            self._set_low_latency()
             time.sleep(0.2)
+            self._stop.clear()
+            self._reader = threading.Thread(target=self._reader_loop, daemon=True)
+            self._reader.start()
         return True
 
+    def _set_low_latency(self):
+        """Linux: set ASYNC_LOW_LATENCY so USB-serial adapters skip their 16 ms latency timer."""
+        try:
+            self.ser.set_low_latency_mode(True)
+        except Exception:
+            # not supported by this driver/platform - nothing to do
+            pass
+
     def close(self):
+        self._stop.set()
+        if self._reader and self._reader is not threading.current_thread():
+            self._reader.join(timeout=1)
+        self._reader = None
         with self.lock:
             if self.ser:
                 try:
@@ -44,51 +154,159 @@ class SerialComm:
                 except Exception:
                     pass
                 self.ser = None
+        self._drain()
+        # wake a command still waiting for a response so its worker can finish
+        self._rx_queue.put(_PORT_CLOSED)
 
     def is_open(self):
         with self.lock:
-            return self.ser is not None and self.ser.is_open
-
-    def send_cmd(self, cmd, timeout=READ_TIMEOUT):
-        with self.lock:
-            if not self.ser or not self.ser.is_open:
-                raise RuntimeError("Serial port not open")
-            try:
-                self.ser.reset_input_buffer()
-            except Exception:
-                pass
-
-            cmd_line = cmd.strip() + "\n"
-            self.ser.write(cmd_line.encode('utf-8'))
-
-            old_timeout = self.ser.timeout
-            self.ser.timeout = timeout
-            try:
-                raw = self.ser.readline()
-            finally:
-                self.ser.timeout = old_timeout
+            return self.ser is not None and self.ser.is_open and self._read_error is None
 
-            if not raw:
-                raise TimeoutError(f"No response within {timeout}s for command: {cmd}")
+    def _reader_loop(self):
+        """Background thread: owns reads from self.ser, queues complete lines.
 
+        Bytes are pulled in bulk (everything the driver has buffered) rather than
+        via readline(), which on many platforms reads one byte per call.
+        """
+        ser = self.ser
+        buf = bytearray()
+        while not self._stop.is_set():
             try:
-                line = raw.decode('utf-8', errors='replace').strip()
+                data = _read_chunk(ser)
             except Exception as e:
-                raise RuntimeError("Failed to decode response: " + str(e))
-
-            # Try parse JSON or extract JSON substring
-            parsed = None
+                # port is dead (e.g. unplugged): report closed and wake any waiter
+                self._read_error = e
+                self._rx_queue.put(_READER_FAILED)
+                break
+            if not data:
+                continue
+            # only the newly read bytes can contain a new line terminator
+            start = len(buf)
+            buf += data
+            while True:
+                idx = buf.find(b'\n', start)
+                if idx < 0:
+                    break
+                self._rx_queue.put(bytes(buf[:idx + 1]))
+                del buf[:idx + 1]
+                start = 0
+
+    def _read_failure(self):
+        return RuntimeError(f"Serial read failed ({self._read_error}); reconnect the port")
+
+    def _drain(self):
+        while True:
             try:
-                parsed = json.loads(line)
-            except Exception:
-                m = re.search(r'\{.*\}', line)
-                if m:
-                    try:
-                        parsed = json.loads(m.group(0))
-                    except Exception:
-                        parsed = None
-
-            return parsed, line
+                self._rx_queue.get_nowait()
+            except queue.Empty:
+                break
+
+    @classmethod
+    def _encode(cls, cmd):
+        """Wire bytes for cmd; argument-less commands are memoized."""
+        data = cls._CMD_CACHE.get(cmd)
+        if data is None:
+            data = cmd.strip().encode('utf-8') + b'\n'
+            # commands with arguments (SET_LED n, CALIBRATE g) would grow the cache unbounded
+            if ' ' not in cmd.strip():
+                cls._CMD_CACHE[cmd] = data
+        return data
+
+    def send_cmd(self, cmd, timeout=READ_TIMEOUT, lazy=False):
+        return self.send_many([cmd], timeout=timeout, lazy=lazy)[0]
+
+    def send_many(self, cmds, timeout=READ_TIMEOUT, lazy=False):
+        """Write several commands in one go and collect one response line per command.
+
+        The firmware handles commands in arrival order, so responses come back
+        in the same order. timeout applies to each response. With lazy=True,
+        large responses come back as a ResponseSummary instead of a full parse.
+
+        Thread-safe: concurrent callers are serialized for the whole
+        write-and-read exchange, so they can't take each other's responses.
+        """
+        with self._txn_lock:
+            with self.lock:
+                if not self.ser or not self.ser.is_open:
+                    raise RuntimeError("Serial port not open")
+                if self._read_error is not None:
+                    raise self._read_failure()
+                # discard anything the board printed since the last response
+                self._drain()
+                if len(cmds) == 1:
+                    self.ser.write(self._encode(cmds[0]))
+                else:
+                    self.ser.write(b"".join(map(self._encode, cmds)))
+
+            results = []
+            for cmd in cmds:
+                try:
+                    raw = self._rx_queue.get(timeout=timeout)
+                except queue.Empty:
+                    raise TimeoutError(f"No response within {timeout}s for command: {cmd}")
+                if raw is _READER_FAILED:
+                    raise self._read_failure()
+                if raw is _PORT_CLOSED:
+                    raise RuntimeError("Serial port closed")
+                results.append(self._parse_line(raw, lazy))
+            return results
+
+    @staticmethod
+    def _parse_line(raw, lazy=False):
+        line = raw.decode('utf-8', errors='replace').strip()
+        # firmware responses are one JSON object per line; anything else
+        # (debug prints, noise) skips the parser entirely
+        if raw[:1] != b'{':
+            return None, line
+        # only lines too big to show inline anyway; smaller ones get the normal
+        # full parse so compact/pretty display applies to them
+        if lazy and len(line) > LARGE_JSON_CHARS:
+            summary = SerialComm.parse_summary(line)
+            if summary is not None:
+                return summary, line
+        try:
+            parsed = json.loads(raw)
+        except ValueError:  # JSONDecodeError or invalid utf-8
+            parsed = _try_extract_json(raw)
+        return parsed, line
+
+    @staticmethod
+    def parse_summary(text):
+        """Pull the top-level ok/cmd/msg out of a response without parsing the payload.
+
+        mkJson() emits the scalar ok/cmd/msg fields before the data object, so the
+        scan stops at the first nested value (or once all three are seen).
+        Best-effort: the rest of the document is not validated, only that the
+        line is brace-terminated (catches truncation). Returns None if the
+        leading fields don't look like that.
+        """
+        if not (text.startswith('{') and text.endswith('}')):
+            return None
+        fields = {}
+        try:
+            idx = _WS.match(text, 1).end()
+            while text[idx] == '"':
+                key, idx = _scanstring(text, idx + 1)
+                idx = _WS.match(text, idx).end()
+                if text[idx] != ':':
+                    return None
+                idx = _WS.match(text, idx + 1).end()
+                if text[idx] in '{[':
+                    break  # reached the payload
+                value, idx = _DECODER.raw_decode(text, idx)
+                if key in _SUMMARY_KEYS:
+                    fields[key] = value
+                    if len(fields) == len(_SUMMARY_KEYS):
+                        break
+                idx = _WS.match(text, idx).end()
+                if text[idx] != ',':
+                    break
+                idx = _WS.match(text, idx + 1).end()
+        except (ValueError, IndexError):
+            return None
+        if "cmd" not in fields:
+            return None
+        return ResponseSummary(fields, text)
 
 # ---------------- GUI app ----------------
 class DAQGui(tk.Tk):
@@ -99,16 +317,31 @@ class DAQGui(tk.Tk):
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
         self.comm = SerialComm()
+        self._connected = False  # what the Connect/Disconnect button reflects
+        # one worker: commands run in the order they were issued
+        self._exec = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='daq')
+        self._log_queue = collections.deque()
+        self._ts_cache = (0, '')
+        self._verbose_json = False
+        self._details = {}  # placeholder tag -> parsed JSON shown on click
+        self._details_ids = itertools.count()
+        self._inserted_tags = []  # placeholder tags inserted so far (Tk thread only)
         self._create_widgets()
         self._layout_widgets()
 
-        # Keep port list updated
-        self.after(1000, self.update_serial_ports)
+        self.after(LOG_FLUSH_MS, self._flush_log)
+
+        # Keep port list updated. The first scan runs on a worker thread once the
+        # mainloop is up (its result is marshalled back via after()), so startup
+        # never blocks on comports().
+        self._ports = ()
+        self.after_idle(self.update_serial_ports)
+        self.after(PORT_POLL_MS, self._poll_serial_ports)
 
     def _create_widgets(self):
         # Connection frame
         self.frm_serial = ttk.LabelFrame(self, text="Connection")
-        self.cmb_ports = ttk.Combobox(self.frm_serial, values=self._list_ports(), state="readonly", width=30)
+        self.cmb_ports = ttk.Combobox(self.frm_serial, values=[], state="readonly", width=30)
         self.btn_refresh = ttk.Button(self.frm_serial, text="Refresh", command=self.update_serial_ports)
         self.ent_baud = ttk.Entry(self.frm_serial, width=8); self.ent_baud.insert(0, str(BAUDRATE))
         self.btn_connect = ttk.Button(self.frm_serial, text="Connect", command=self.connect_serial)
@@ -128,19 +361,22 @@ class DAQGui(tk.Tk):
         # LED control (label simplified)
         self.frm_led = ttk.LabelFrame(self.frm_controls, text="LED")
         # inverted numeric range visually: from 255 -> 0 so sliding right decreases numeric value
-        self.led_scale = ttk.Scale(self.frm_led, from_=255, to=0, orient=tk.HORIZONTAL)
-        self.led_scale.set(255)  # default dim (right-most)
+        self.led_var = tk.IntVar(value=255)  # default dim (right-most)
+        self.led_scale = ttk.Scale(self.frm_led, from_=255, to=0, orient=tk.HORIZONTAL, variable=self.led_var)
         self.btn_set_led = ttk.Button(self.frm_led, text="SET_LED", command=self.set_led_from_scale)
         self.btn_get_led = ttk.Button(self.frm_led, text="GET_LED", command=lambda: self._run_cmd_async("GET_LED"))
 
+        # Calibration and full test share a notebook; only the visible tab is mapped
+        self.nb = ttk.Notebook(self)
+
         # Calibration
-        self.frm_cal = ttk.LabelFrame(self, text="Load Cell Calibration")
+        self.frm_cal = ttk.Frame(self.nb)
         self.btn_tare = ttk.Button(self.frm_cal, text="TARE", command=lambda: self._run_cmd_async("TARE"))
         self.btn_calibrate = ttk.Button(self.frm_cal, text="Start Calibration (guided)", command=self.calibration_walkthrough)
         self.lbl_cal_instructions = ttk.Label(self.frm_cal, text="Guided calibration: follow prompts to place known weight.")
 
         # Full test
-        self.frm_test = ttk.LabelFrame(self, text="Full System Test")
+        self.frm_test = ttk.Frame(self.nb)
         self.btn_full_test = ttk.Button(self.frm_test, text="Run Full Automated Test", command=self.full_system_test)
         self.chk_save_test = tk.BooleanVar(value=True)
         self.chk_save_file = ttk.Checkbutton(self.frm_test, text="Create test recording file on SD", variable=self.chk_save_test)
@@ -148,7 +384,17 @@ class DAQGui(tk.Tk):
         # Responses pane (single)
         self.frm_responses = ttk.LabelFrame(self, text="Responses")
         self.txt_responses = scrolledtext.ScrolledText(self.frm_responses, wrap=tk.WORD)
-        self.txt_responses.configure(state=tk.DISABLED)
+        # Read-only without toggling state on every insert: swallow edits, keep
+        # navigation, selection and copy working
+        # Control everywhere; Mod1 is Command only on macOS (on Windows it is NumLock)
+        self._copy_mask = 0x4 | 0x8 if self.tk.call('tk', 'windowingsystem') == 'aqua' else 0x4
+        self.txt_responses.bind("<Key>", self._block_edit_keys)
+        for seq in ("<<Cut>>", "<<Paste>>", "<<PasteSelection>>", "<<Clear>>"):
+            self.txt_responses.bind(seq, lambda e: "break")
+        self.txt_responses.tag_configure("details", foreground="blue", underline=True)
+        self.verbose_json = tk.BooleanVar(value=False)
+        self.chk_verbose_json = ttk.Checkbutton(self.frm_responses, text="Pretty JSON", variable=self.verbose_json,
+                                                command=self._on_verbose_toggle)
 
         # Status bar
         self.status_var = tk.StringVar(value="Ready")
@@ -192,43 +438,85 @@ class DAQGui(tk.Tk):
         self.btn_set_led.grid(row=0, column=1, padx=6, pady=6)
         self.btn_get_led.grid(row=0, column=2, padx=6, pady=6)
 
-        # Calibration and full-test frames on right column
-        self.frm_cal.grid(row=2, column=0, sticky="nsew", padx=PAD, pady=PAD)
-        self.frm_test.grid(row=2, column=1, sticky="nsew", padx=PAD, pady=PAD)
-        self.frm_cal.grid_columnconfigure(0, weight=1)
-        self.frm_test.grid_columnconfigure(0, weight=1)
-        self.lbl_cal_instructions.grid(row=0, column=0, columnspan=2, sticky="w", padx=6, pady=(4,2))
-        self.btn_tare.grid(row=1, column=0, padx=6, pady=6, sticky="ew")
-        self.btn_calibrate.grid(row=1, column=1, padx=6, pady=6, sticky="ew")
-        self.btn_full_test.grid(row=0, column=0, padx=6, pady=6, sticky="ew")
-        self.chk_save_file.grid(row=0, column=1, padx=6, pady=6)
+        # Calibration and full-test tabs; tab contents are gridded the first time
+        # each tab is shown (see _on_tab_changed)
+        self.nb.add(self.frm_cal, text="Load Cell Calibration")
+        self.nb.add(self.frm_test, text="Full System Test")
+        self.nb.grid(row=2, column=0, columnspan=2, sticky="nsew", padx=PAD, pady=PAD)
+        self._tab_layouts = {
+            str(self.frm_cal): self._layout_cal_tab,
+            str(self.frm_test): self._layout_test_tab,
+        }
+        self.nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed()  # lay out the initially selected tab
 
         # Responses pane (fills remaining area)
         self.frm_responses.grid(row=3, column=0, columnspan=2, sticky="nsew", padx=PAD, pady=PAD)
         self.frm_responses.grid_columnconfigure(0, weight=1)
         self.frm_responses.grid_rowconfigure(0, weight=1)
         self.txt_responses.grid(row=0, column=0, sticky="nsew", padx=6, pady=6)
+        self.chk_verbose_json.grid(row=1, column=0, sticky="w", padx=6, pady=(0,4))
 
         # Status bar
         self.status_bar.grid(row=4, column=0, columnspan=2, sticky="ew")
 
+    def _on_tab_changed(self, event=None):
+        layout = self._tab_layouts.pop(self.nb.select(), None)
+        if layout:
+            layout()
+
+    def _layout_cal_tab(self):
+        self.frm_cal.grid_columnconfigure(0, weight=1)
+        self.lbl_cal_instructions.grid(row=0, column=0, columnspan=2, sticky="w", padx=6, pady=(4,2))
+        self.btn_tare.grid(row=1, column=0, padx=6, pady=6, sticky="ew")
+        self.btn_calibrate.grid(row=1, column=1, padx=6, pady=6, sticky="ew")
+
+    def _layout_test_tab(self):
+        self.frm_test.grid_columnconfigure(0, weight=1)
+        self.btn_full_test.grid(row=0, column=0, padx=6, pady=6, sticky="ew")
+        self.chk_save_file.grid(row=0, column=1, padx=6, pady=6)
+
     # ---------------- port helpers ----------------
     def _list_ports(self):
         return [p.device for p in serial.tools.list_ports.comports()]
 
     def update_serial_ports(self):
-        ports = self._list_ports()
-        self.cmb_ports['values'] = ports
+        # comports() is a slow sysfs/SetupAPI scan; keep it off the Tk thread
+        threading.Thread(target=self._scan_ports, daemon=True).start()
+
+    def _poll_serial_ports(self):
+        if self._connected and not self.comm.is_open():
+            # reader thread hit a read error (e.g. unplugged)
+            self.comm.close()
+            self._set_disconnected("Connection lost")
+            self._log_response_plain("Connection lost")
+        # no point rescanning while connected
+        if not self._connected:
+            self.update_serial_ports()
+        self.after(PORT_POLL_MS, self._poll_serial_ports)
+
+    def _scan_ports(self):
+        ports = tuple(sorted(self._list_ports()))
+        self.after(0, self._apply_ports, ports)
+
+    def _apply_ports(self, ports):
+        if ports != self._ports:
+            self._ports = ports
+            self.cmb_ports['values'] = ports
         if not self.cmb_ports.get() and ports:
             self.cmb_ports.set(ports[0])
-        self.after(2000, self.update_serial_ports)
+
+    def _set_disconnected(self, status):
+        self._connected = False
+        self.btn_connect.config(text="Connect")
+        self.lbl_status.config(text="Not connected", foreground="red")
+        self.status_var.set(status)
 
     def connect_serial(self):
-        if self.comm.is_open():
+        # toggle on our own flag: comm.is_open() also goes False after a read error
+        if self._connected:
             self.comm.close()
-            self.btn_connect.config(text="Connect")
-            self.lbl_status.config(text="Not connected", foreground="red")
-            self.status_var.set("Disconnected")
+            self._set_disconnected("Disconnected")
             return
 
         port = self.cmb_ports.get()
@@ -240,61 +528,159 @@ class DAQGui(tk.Tk):
         except Exception:
             baud = BAUDRATE
         try:
-            self.comm.open(port, baud, timeout=READ_TIMEOUT)
+            self.comm.open(port, baud)
         except Exception as e:
             messagebox.showerror("Connection error", f"Failed to open {port}:\n{e}")
             return
 
+        self._connected = True
         self.btn_connect.config(text="Disconnect")
         self.lbl_status.config(text=f"Connected: {port}", foreground="green")
         self.status_var.set(f"Connected {port}")
         self._log_response_plain(f"Connected to {port} @ {baud}")
 
     def on_close(self):
-        if self.comm.is_open():
-            try:
-                self.comm.close()
-            except:
-                pass
+        # close first: that wakes a command blocked on a response, so the
+        # (non-daemon) executor worker can exit instead of holding the process open
+        try:
+            self.comm.close()
+        except:
+            pass
+        self._exec.shutdown(wait=False, cancel_futures=True)
         self.destroy()
 
     # ---------------- responses logging ----------------
+    # Log helpers may be called from worker threads, so they only queue text;
+    # _flush_log (Tk thread) writes everything queued in one insert.
+    def _ts(self):
+        """Log timestamp; strftime only runs when the second changes."""
+        s = int(time.time())
+        cache = self._ts_cache
+        if s != cache[0]:
+            cache = self._ts_cache = (s, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(s)))
+        return cache[1]
+
     def _log_response_plain(self, text):
         """Add a plain text line to responses (unstructured)."""
-        self.txt_responses.configure(state=tk.NORMAL)
-        self.txt_responses.insert(tk.END, f"{time.strftime('%Y-%m-%d %H:%M:%S')} | {text}\n")
-        self.txt_responses.see(tk.END)
-        self.txt_responses.configure(state=tk.DISABLED)
+        self._log_queue.append(f"{self._ts()} | {text}\n")
 
     def _log_response(self, raw, parsed=None):
-        """Pretty-print parsed JSON (if available) and a concise summary line."""
-        self.txt_responses.configure(state=tk.NORMAL)
-        ts = time.strftime('%Y-%m-%d %H:%M:%S')
+        """Log a concise summary line plus the parsed JSON (if available).
+
+        JSON is shown as a compact one-liner unless "Pretty JSON" is ticked.
+        Large payloads (LIST_FILES, calibration results) are collapsed to a
+        placeholder that expands to the indented form when clicked.
+        """
+        ts = self._ts()
         if parsed and isinstance(parsed, dict):
-            # Summary line
-            ok = parsed.get("ok")
-            cmd = parsed.get("cmd", "")
-            msg = parsed.get("msg", "")
-            summary = f"{ts} | {cmd} | ok={ok} | msg={msg}\n"
-            pretty = json.dumps(parsed, indent=2)
-            self.txt_responses.insert(tk.END, summary)
-            self.txt_responses.insert(tk.END, pretty + "\n\n")
+            parts = (ts, ' | ', str(parsed.get("cmd", "")), ' | ok=', str(parsed.get("ok")),
+                     ' | msg=', str(parsed.get("msg", "")), '\n')
+            if isinstance(parsed, ResponseSummary):
+                self._queue_details(''.join(parts), f"{len(parsed.text)} bytes", parsed)
+                return
+            compact = _COMPACT_JSON.encode(parsed)
+            if len(compact) > LARGE_JSON_CHARS:
+                self._queue_details(''.join(parts), f"{len(parsed)} keys", parsed)
+                return
+            body = _PRETTY_JSON.encode(parsed) if self._verbose_json else compact
+            # summary line and body go in as one string -> one insert
+            self._log_queue.append(''.join(parts + (body, '\n\n')))
         else:
             # fallback to raw line
-            self.txt_responses.insert(tk.END, f"{ts} | RAW: {raw}\n\n")
-        self.txt_responses.see(tk.END)
-        self.txt_responses.configure(state=tk.DISABLED)
+            self._log_queue.append(''.join((ts, ' | RAW: ', str(raw), '\n\n')))
+
+    def _queue_details(self, summary, label, parsed):
+        """Queue a summary line followed by a click-to-expand placeholder for parsed."""
+        tag = f"details{next(self._details_ids)}"
+        self._details[tag] = parsed
+        self._log_queue.append(summary)
+        self._log_queue.append((f"{{\u2026 {label}, click to expand}}", tag))
+        self._log_queue.append("\n\n")
+
+    def _flush_log(self):
+        # queue items are plain strings or (text, tag) for click-to-expand placeholders
+        args = []
+        plain = []
+        new_tags = []
+        while self._log_queue:
+            item = self._log_queue.popleft()
+            if isinstance(item, str):
+                plain.append(item)
+                continue
+            text, tag = item
+            if plain:
+                args += [''.join(plain), ()]
+                plain = []
+            args += [text, (tag, "details")]
+            new_tags.append(tag)
+        if plain:
+            args += [''.join(plain), ()]
+        if args:
+            self.txt_responses.insert(tk.END, *args)
+            self._inserted_tags.extend(new_tags)
+            for tag in new_tags:
+                self.txt_responses.tag_bind(tag, "<Button-1>", lambda e, t=tag: self._expand_details(t))
+            # bound memory and redraw cost
+            if int(self.txt_responses.index('end-1c').split('.')[0]) > LOG_MAX_LINES:
+                self.txt_responses.delete('1.0', f'{LOG_TRIM_LINES + 1}.0')
+                # only prune tags already in the widget; workers may be adding to
+                # _details concurrently, so never iterate the dict itself
+                live = []
+                for tag in self._inserted_tags:
+                    if self.txt_responses.tag_ranges(tag):
+                        live.append(tag)
+                    else:
+                        self._details.pop(tag, None)
+                self._inserted_tags = live
+            self.txt_responses.see(tk.END)
+        self.after(LOG_FLUSH_MS, self._flush_log)
+
+    def _expand_details(self, tag):
+        """Replace a collapsed placeholder with the indented JSON it stands for."""
+        parsed = self._details.pop(tag, None)
+        ranges = self.txt_responses.tag_ranges(tag)
+        if parsed is None or not ranges:
+            return
+        if isinstance(parsed, ResponseSummary):
+            try:
+                pretty = _PRETTY_JSON.encode(parsed.full())
+            except ValueError:
+                pretty = parsed.text  # summary scanned fine but the payload is malformed
+        else:
+            pretty = _PRETTY_JSON.encode(parsed)
+        start, end = ranges[0], ranges[-1]
+        self.txt_responses.delete(start, end)
+        self.txt_responses.insert(start, pretty)
+        self.txt_responses.tag_delete(tag)
+
+    def _block_edit_keys(self, event):
+        # Text's own <Tab> binding would insert a tab, so do focus traversal here
+        if event.keysym == "ISO_Left_Tab" or (event.keysym == "Tab" and event.state & 0x1):
+            event.widget.tk_focusPrev().focus_set()
+            return "break"
+        if event.keysym == "Tab":
+            event.widget.tk_focusNext().focus_set()
+            return "break"
+        if event.keysym in _NAV_KEYS:
+            return None
+        if event.state & self._copy_mask and event.keysym.lower() in ("c", "a"):  # copy / select
+            return None
+        return "break"
+
+    def _on_verbose_toggle(self):
+        # plain bool copy so worker threads never read the Tk variable
+        self._verbose_json = self.verbose_json.get()
 
     # ---------------- async command wrapper ----------------
     def _run_cmd_async(self, cmd, timeout=READ_TIMEOUT, callback=None):
-        t = threading.Thread(target=self._cmd_worker, args=(cmd, timeout, callback), daemon=True)
-        t.start()
+        self._exec.submit(self._cmd_worker, cmd, timeout, callback)
 
     def _cmd_worker(self, cmd, timeout, callback):
         self.status_var.set(f"Sending: {cmd}")
         self._log_response_plain(f">>> {cmd}")
         try:
-            parsed, raw = self.comm.send_cmd(cmd, timeout=timeout)
+            # callbacks get the full document; plain button presses only need the summary
+            parsed, raw = self.comm.send_cmd(cmd, timeout=timeout, lazy=callback is None)
             self._log_response(raw, parsed)
             if callback:
                 callback(True, parsed, raw)
@@ -310,8 +696,7 @@ class DAQGui(tk.Tk):
     # ---------------- actions ----------------
     def set_led_from_scale(self):
         # slider already inverted: value = brightness to send
-        val = int(self.led_scale.get())
-        self._run_cmd_async(f"SET_LED {val}")
+        self._run_cmd_async(f"SET_LED {self.led_var.get()}")
 
     def calibration_walkthrough(self):
         if not self.comm.is_open():
@@ -351,44 +736,25 @@ class DAQGui(tk.Tk):
         if not self.comm.is_open():
             messagebox.showwarning("Not connected", "Connect to the board first")
             return
-        t = threading.Thread(target=self._full_test_worker, daemon=True)
-        t.start()
+        # same single worker as button commands, so the test runs in order with them
+        self._exec.submit(self._full_test_worker)
 
     def _full_test_worker(self):
         self.status_var.set("Running full test...")
-        steps = [
-            ("PING", 3),
-            ("STATUS", 3),
-            ("TEST_TEMP", 3),
-            ("TEST_PRESSURE", 3),
-        ]
-        for cmd, to in steps:
-            try:
-                parsed, raw = self.comm.send_cmd(cmd, timeout=to)
-                self._log_response(raw, parsed)
-            except Exception as e:
-                self._log_response(str(e), None)
-            time.sleep(0.2)
+        self._send_batch(["PING", "STATUS", "TEST_TEMP", "TEST_PRESSURE"], timeout=3)
 
         # READ several times
-        for i in range(4):
-            try:
-                parsed, raw = self.comm.send_cmd("READ", timeout=3)
-                self._log_response(raw, parsed)
-            except Exception as e:
-                self._log_response(str(e), None)
-            time.sleep(0.2)
+        self._send_batch(["READ"] * 4, timeout=3)
 
         # optional recording test
         if self.chk_save_test.get():
             try:
-                parsed, raw = self.comm.send_cmd("START", timeout=5)
+                parsed, raw = self.comm.send_cmd("START", timeout=5, lazy=True)
                 self._log_response(raw, parsed)
-                for i in range(6):
-                    parsed, raw = self.comm.send_cmd("READ", timeout=3)
-                    self._log_response(raw, parsed)
-                    time.sleep(0.2)
-                parsed, raw = self.comm.send_cmd("STOP", timeout=5)
+                self._send_batch(["READ"] * 6, timeout=3)
+                # let the board log samples for a while so the test file isn't empty
+                time.sleep(RECORD_TEST_SECONDS)
+                parsed, raw = self.comm.send_cmd("STOP", timeout=5, lazy=True)
                 self._log_response(raw, parsed)
             except Exception as e:
                 self._log_response(str(e), None)
@@ -397,13 +763,35 @@ class DAQGui(tk.Tk):
 
         # LIST_FILES and show in responses
         try:
-            parsed, raw = self.comm.send_cmd("LIST_FILES", timeout=5)
+            parsed, raw = self.comm.send_cmd("LIST_FILES", timeout=5, lazy=True)
             self._log_response(raw, parsed)
         except Exception as e:
             self._log_response(str(e), None)
 
         self.status_var.set("Full test complete")
 
+    def _send_batch(self, cmds, timeout):
+        """Send cmds as one batch; fall back to one at a time if the batch fails
+        or the responses don't line up with the commands (e.g. an unsolicited line)."""
+        try:
+            results = self.comm.send_many(cmds, timeout=timeout, lazy=True)
+            for cmd, (parsed, raw) in zip(cmds, results):
+                if not isinstance(parsed, dict) or parsed.get("cmd") != cmd.split()[0].upper():
+                    raise RuntimeError(f"unexpected response to {cmd}: {raw}")
+        except Exception as e:
+            self._log_response_plain(f"Batch failed ({e}), retrying commands individually")
+            results = None
+        if results is not None:
+            for parsed, raw in results:
+                self._log_response(raw, parsed)
+            return
+        for cmd in cmds:
+            try:
+                parsed, raw = self.comm.send_cmd(cmd, timeout=timeout, lazy=True)
+                self._log_response(raw, parsed)
+            except Exception as e:
+                self._log_response(str(e), None)
+
 # ---------------- main ----------------
 def main():
     app = DAQGui()